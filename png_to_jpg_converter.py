@@ -9,86 +9,399 @@ import sys
 import argparse
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, UnidentifiedImageError
 import threading
+import functools
+import contextlib
+import mmap
+import stat
+import io
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# libjpeg-turbo's SIMD encoder is used when PyTurboJPEG and the library are
+# installed; otherwise Pillow's own JPEG encoder is used
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_GRAY, TJSAMP_444, TJSAMP_422, TJSAMP_420, TJSAMP_GRAY
+    _turbo = TurboJPEG()
+    # Pillow subsampling values (0 = 4:4:4, 1 = 4:2:2, 2 = 4:2:0)
+    _TURBO_SUBSAMPLING = {0: TJSAMP_444, 1: TJSAMP_422, 2: TJSAMP_420}
+except (ImportError, OSError, RuntimeError):
+    _turbo = None
+
+
+def _iter_pngs(root):
+    """Yield the paths of all PNG files under root in a single directory walk"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Unreadable or removed during the walk; skip it like rglob() does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.png'):
+                    yield entry.path
+
+
+# Success value returned in place of True when an up-to-date JPG was kept as-is
+SKIPPED = 'skipped'
+
+# Files in flight at once (being read, encoded or written) with --async-io
+ASYNC_IO_DEPTH = 32
+
+def _composite(img, bg_color):
+    """Flatten a transparent RGBA or LA image onto a solid background color"""
+    background = Image.new('RGB', img.size, bg_color)
+    # An RGBA/LA mask uses its own alpha band, so no separate alpha copy is needed
+    background.paste(img, mask=img)
+    return background
+
+
+def _encode_jpeg(image, f, quality, optimize=False, subsampling=2):
+    """Encode an RGB or grayscale image into a binary file"""
+    # Pixels are handed over as RGB on purpose: both encoders convert to YCbCr
+    # and downsample chroma in one SIMD pass row by row, which beats
+    # pre-converting to YCbCr ourselves (Image.draft() can't help either, only
+    # the JPEG decoder implements it)
+    # TurboJPEG cannot build optimized Huffman tables, so leave those to Pillow
+    if _turbo is not None and not optimize:
+        pixels = np.asarray(image)
+        if pixels.ndim == 2:
+            jpeg_bytes = _turbo.encode(pixels, quality=quality, pixel_format=TJPF_GRAY,
+                                       jpeg_subsample=TJSAMP_GRAY)
+        else:
+            jpeg_bytes = _turbo.encode(pixels, quality=quality, pixel_format=TJPF_RGB,
+                                       jpeg_subsample=_TURBO_SUBSAMPLING[subsampling])
+        f.write(jpeg_bytes)
+    else:
+        image.save(f, 'JPEG', quality=quality, optimize=optimize,
+                   progressive=False, subsampling=subsampling)
+
+
+@contextlib.contextmanager
+def _atomic_write(path):
+    """Open a temporary file next to path and move it onto path once written.
+
+    An existing file at path is therefore always complete, which the
+    skip-existing check relies on.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial file behind, even on Ctrl-C
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _save_jpeg(image, jpg_path, quality, optimize=False, subsampling=2):
+    """Encode an RGB or grayscale image to a JPG file"""
+    with _atomic_write(jpg_path) as f:
+        _encode_jpeg(image, f, quality, optimize, subsampling)
+
+
+@contextlib.contextmanager
+def _open_mapped(path):
+    """Open an image from a read-only memory map so the decoder reads straight from the page cache"""
+    with open(path, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            # Ask the kernel to read ahead aggressively
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; report it as Image.open() would
+            raise UnidentifiedImageError(f"cannot identify image file {str(path)!r}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                img = Image.open(mm)
+            except (UnidentifiedImageError, ValueError):
+                # Format probing can seek past the end of a short file, which mmap rejects
+                raise UnidentifiedImageError(f"cannot identify image file {str(path)!r}") from None
+            with img:
+                yield img
+
+
+def _keep_mode(img, bg_color):
+    # JPEG stores RGB and grayscale natively, so encode the decoded pixels as-is
+    return img
+
+
+def _flatten_alpha(img, bg_color):
+    # Per-band extrema of the image itself, rather than of a getchannel() copy
+    if img.getextrema()[-1][0] == 255:
+        # Alpha channel present but fully opaque
+        return img.convert('L' if img.mode == 'LA' else 'RGB')
+    return _composite(img, bg_color)
+
+
+def _flatten_palette(img, bg_color):
+    if 'transparency' not in img.info:
+        # Palette without transparency, nothing to composite
+        return img.convert('RGB')
+    return _flatten_alpha(img.convert('RGBA'), bg_color)
+
+
+def _convert_to_rgb(img, bg_color):
+    return img.convert('RGB')
+
+
+# Per-mode handlers, so each image costs one dict lookup instead of a chain of mode tests
+_FLATTENERS = {
+    'RGB': _keep_mode,
+    'L': _keep_mode,
+    'RGBA': _flatten_alpha,
+    'LA': _flatten_alpha,
+    'P': _flatten_palette,
+}
+
+
+def _flatten(img, bg_color):
+    """Return the pixels of a loaded image in a mode JPEG can store"""
+    return _FLATTENERS.get(img.mode, _convert_to_rgb)(img, bg_color)
+
+
+def _convert_inner(png_path, jpg_path, quality, bg_color, optimize, subsampling):
+    """Decode png_path and encode it to jpg_path, raising on failure"""
+    with _open_mapped(png_path) as img:
+        img.load()
+        flat = _flatten(img, bg_color)
+        if flat is not img:
+            # Free the decoded source before the encoder allocates its own buffers
+            img.close()
+        _save_jpeg(flat, jpg_path, quality, optimize, subsampling)
+    
+    return str(jpg_path)
+
+
+def _plan_output(png_path, resolved_output_dir, overwrite):
+    """Work out where png_path converts to and whether that needs doing.
+
+    Returns (jpg_path, outcome) where outcome is None if the file should be
+    converted, or else the (success, message) result to report as-is.
+    """
+    # Check the predictable failures up front so only decoding and
+    # encoding need to be guarded
+    try:
+        png_stat = os.stat(png_path)
+    except OSError:
+        png_stat = None
+    
+    # Create output filename
+    output_dir = png_path.parent if resolved_output_dir is None else resolved_output_dir
+    jpg_path = output_dir / (png_path.stem + '.jpg')
+    
+    if png_stat is None or not stat.S_ISREG(png_stat.st_mode):
+        return jpg_path, (False, f"File not found: {png_path}")
+    
+    if not overwrite:
+        try:
+            if os.stat(jpg_path).st_mtime >= png_stat.st_mtime:
+                return jpg_path, (SKIPPED, str(jpg_path))
+        except OSError:
+            pass  # No existing JPG
+    
+    return jpg_path, None
+
+
+def convert_file(png_path, resolved_output_dir, quality, bg_color, optimize=False, subsampling=2,
+                 overwrite=False):
+    """Convert a single PNG file to JPG.
+
+    Module-level so it can be pickled and run inside worker processes.
+    resolved_output_dir must be an existing directory, or None to write
+    next to the source file. Unless overwrite is set, a JPG at least as
+    new as the PNG is kept and (SKIPPED, jpg_path) is returned; the check
+    only looks at mtimes, so changed settings need overwrite.
+    """
+    png_path = Path(png_path)
+    jpg_path, outcome = _plan_output(png_path, resolved_output_dir, overwrite)
+    if outcome is not None:
+        return outcome
+    
+    try:
+        return True, _convert_inner(png_path, jpg_path, quality, bg_color, optimize, subsampling)
+    except Exception as e:
+        return False, str(e)
+
+
+def convert_bytes(png_data, quality, bg_color, optimize=False, subsampling=2):
+    """Convert PNG file contents to JPG file contents, raising on failure.
+
+    Module-level so it can be pickled and run inside worker processes.
+    """
+    with Image.open(io.BytesIO(png_data)) as img:
+        img.load()
+        flat = _flatten(img, bg_color)
+        if flat is not img:
+            # Free the decoded source before the encoder allocates its own buffers
+            img.close()
+        out = io.BytesIO()
+        _encode_jpeg(flat, out, quality, optimize, subsampling)
+    return out.getvalue()
+
+
+def _read_source(png_path, resolved_output_dir, overwrite):
+    """Run convert_file's checks on png_path and read it into memory.
+
+    Returns (jpg_path, outcome, png_data); png_data is None when outcome is set.
+    """
+    png_path = Path(png_path)
+    jpg_path, outcome = _plan_output(png_path, resolved_output_dir, overwrite)
+    if outcome is not None:
+        return jpg_path, outcome, None
+    with open(png_path, 'rb') as f:
+        return jpg_path, None, f.read()
+
+
+def _write_file(path, data):
+    """Write data to path, replacing any existing file only once the write succeeds"""
+    with _atomic_write(path) as f:
+        f.write(data)
+
 
 class PNGtoJPGConverter:
-    def __init__(self):
+    def __init__(self, use_processes=True):
         self.quality = 95
         self.background_color = (255, 255, 255)  # White background for transparency
-        
+        # Processes suit CPU-bound encoding; threads avoid pickling overhead and
+        # overlap I/O on fast disks since Pillow releases the GIL while coding
+        self.use_processes = use_processes
+        # A second Huffman pass costs a lot of CPU for a few percent smaller files
+        self.optimize = False
+        self.subsampling = 2  # 4:2:0 chroma subsampling
+        # Re-encode even when an up-to-date JPG already exists
+        self.overwrite = False
+        # Overlap file reads and writes with encoding; helps most with many small
+        # files on fast local disks
+        self.async_io = False
+        
+    def _encoder_settings(self, quality):
+        return {
+            'quality': quality if quality is not None else self.quality,
+            'bg_color': self.background_color,
+            'optimize': self.optimize,
+            'subsampling': self.subsampling,
+        }
+    
+    def _make_encoder(self, output_dir, quality):
+        """Bind the settings shared by every file into a function of the PNG path alone"""
+        return functools.partial(
+            convert_file,
+            resolved_output_dir=output_dir,
+            overwrite=self.overwrite,
+            **self._encoder_settings(quality),
+        )
+    
+    async def _convert_async(self, executor, paths, indices, output_dir, quality, record):
+        """Convert paths[i] for each i in indices, overlapping file I/O with encoding.
+
+        ASYNC_IO_DEPTH workers each take the next file, read it on an I/O
+        thread pool, encode it on executor and write it back on the I/O pool,
+        then pass the outcome to record(i, success, result).
+        """
+        loop = asyncio.get_running_loop()
+        encode = functools.partial(convert_bytes, **self._encoder_settings(quality))
+        pending = iter(indices)
+        
+        async def worker():
+            for i in pending:
+                try:
+                    jpg_path, outcome, png_data = await loop.run_in_executor(
+                        io_pool, _read_source, paths[i], output_dir, self.overwrite)
+                    if outcome is None:
+                        jpeg_data = await loop.run_in_executor(executor, encode, png_data)
+                        await loop.run_in_executor(io_pool, _write_file, jpg_path, jpeg_data)
+                        outcome = True, str(jpg_path)
+                except UnidentifiedImageError:
+                    outcome = False, f"cannot identify image file {paths[i]!r}"
+                except Exception as e:
+                    outcome = False, str(e)
+                record(i, *outcome)
+        
+        with ThreadPoolExecutor(max_workers=ASYNC_IO_DEPTH) as io_pool:
+            await asyncio.gather(*(worker() for _ in range(ASYNC_IO_DEPTH)))
+    
     def convert_single_file(self, png_path, output_dir=None, quality=None):
         """Convert a single PNG file to JPG"""
-        try:
-            png_path = Path(png_path)
-            if not png_path.exists():
-                raise FileNotFoundError(f"File not found: {png_path}")
-            
-            # Set output directory
-            if output_dir is None:
-                output_dir = png_path.parent
-            else:
-                output_dir = Path(output_dir)
-                output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create output filename
-            jpg_filename = png_path.stem + '.jpg'
-            jpg_path = output_dir / jpg_filename
-            
-            # Open and convert image
-            with Image.open(png_path) as img:
-                # Convert RGBA to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create a white background
-                    background = Image.new('RGB', img.size, self.background_color)
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Save as JPG
-                save_quality = quality if quality is not None else self.quality
-                img.save(jpg_path, 'JPEG', quality=save_quality, optimize=True)
-                
-            return True, str(jpg_path)
-            
-        except Exception as e:
-            return False, str(e)
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+        return self._make_encoder(output_dir, quality)(png_path)
     
     def batch_convert(self, input_dir, output_dir=None, quality=None, progress_callback=None):
-        """Convert all PNG files in a directory"""
+        """Convert all PNG files in a directory.
+
+        Returns (converted, skipped, errors): output paths of converted files,
+        output paths of files whose JPG was already up to date, and error messages.
+        """
         input_dir = Path(input_dir)
         if not input_dir.exists():
             raise FileNotFoundError(f"Directory not found: {input_dir}")
         
-        # Find all PNG files
-        png_files = list(input_dir.rglob('*.png')) + list(input_dir.rglob('*.PNG'))
-        
-        if not png_files:
-            return [], ["No PNG files found in the specified directory"]
-        
-        successful_conversions = []
-        errors = []
-        
-        for i, png_file in enumerate(png_files):
-            if progress_callback:
-                progress_callback(i, len(png_files), str(png_file.name))
-            
-            success, result = self.convert_single_file(png_file, output_dir, quality)
+        # Create the output directory once rather than once per file
+        if output_dir is not None:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Walk once up front and keep per-file data in parallel lists indexed by file
+        paths = list(_iter_pngs(input_dir))
+        total = len(paths)
+        if not paths:
+            return [], [], ["No PNG files found in the specified directory"]
+        
+        # Preallocated by file index so results keep walk order whatever order workers finish in
+        results = [None] * total  # Output path of each converted file
+        skipped_list = [None] * total  # Output path of each file left as already up to date
+        errors_list = [None] * total  # Error message of each failed file
+        done = 0
+        
+        def record(i, success, result):
+            nonlocal done
+            if success == SKIPPED:
+                skipped_list[i] = result
+            elif success:
+                results[i] = result
+            else:
+                errors_list[i] = f"{os.path.basename(paths[i])}: {result}"
+            done += 1
             
-            if success:
-                successful_conversions.append(result)
+            # Report every 32 files rather than every file
+            if progress_callback and ((done & 31) == 0 or done == total):
+                progress_callback(done, total, os.path.basename(paths[i]))
+        
+        # Never start more workers than there are files
+        cpu_count = os.cpu_count() or 1
+        if self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=min(cpu_count, total))
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(32, cpu_count * 2, total))
+        
+        with executor:
+            pending = range(total)
+            if self.async_io:
+                asyncio.run(self._convert_async(executor, paths, pending, output_dir, quality, record))
             else:
-                errors.append(f"{png_file.name}: {result}")
+                encode = self._make_encoder(output_dir, quality)
+                futures = {executor.submit(encode, paths[i]): i for i in pending}
+                for future in as_completed(futures):
+                    record(futures[future], *future.result())
         
         if progress_callback:
-            progress_callback(len(png_files), len(png_files), "Conversion complete!")
+            progress_callback(total, total, "Conversion complete!")
         
-        return successful_conversions, errors
+        successful_conversions = [r for r in results if r is not None]
+        skipped = [r for r in skipped_list if r is not None]
+        errors = [e for e in errors_list if e is not None]
+        return successful_conversions, skipped, errors
 
 
 class ConverterGUI:
@@ -99,6 +412,10 @@ class ConverterGUI:
         self.root.resizable(True, True)
         
         self.converter = PNGtoJPGConverter()
+        # Latest progress from the worker thread, applied to the UI by _flush_progress
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._flush_job = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -131,24 +448,33 @@ class ConverterGUI:
         ttk.Scale(quality_frame, from_=1, to=100, variable=self.quality_var, orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Label(quality_frame, textvariable=self.quality_var, width=3).pack(side=tk.RIGHT, padx=(10, 0))
         
+        # Encoder options
+        ttk.Label(main_frame, text="Options:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.optimize_var = tk.BooleanVar(value=False)
+        options_frame = ttk.Frame(main_frame)
+        options_frame.grid(row=3, column=1, padx=(10, 0), pady=5, sticky=tk.W)
+        ttk.Checkbutton(options_frame, text="Optimize file size (slower)", variable=self.optimize_var).pack(side=tk.LEFT)
+        self.skip_existing_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="Skip existing", variable=self.skip_existing_var).pack(side=tk.LEFT, padx=(10, 0))
+        
         # Convert button
         self.convert_btn = ttk.Button(main_frame, text="Convert PNG to JPG", command=self.start_conversion)
-        self.convert_btn.grid(row=3, column=0, columnspan=3, pady=20)
+        self.convert_btn.grid(row=4, column=0, columnspan=3, pady=20)
         
         # Progress bar
         self.progress_var = tk.StringVar(value="Ready")
-        ttk.Label(main_frame, textvariable=self.progress_var).grid(row=4, column=0, columnspan=3, pady=5)
+        ttk.Label(main_frame, textvariable=self.progress_var).grid(row=5, column=0, columnspan=3, pady=5)
         self.progress_bar = ttk.Progressbar(main_frame, mode='determinate')
-        self.progress_bar.grid(row=5, column=0, columnspan=3, pady=5, sticky=(tk.W, tk.E))
+        self.progress_bar.grid(row=6, column=0, columnspan=3, pady=5, sticky=(tk.W, tk.E))
         
         # Results text area
-        ttk.Label(main_frame, text="Results:").grid(row=6, column=0, sticky=(tk.W, tk.N), pady=(10, 0))
+        ttk.Label(main_frame, text="Results:").grid(row=7, column=0, sticky=(tk.W, tk.N), pady=(10, 0))
         
         text_frame = ttk.Frame(main_frame)
-        text_frame.grid(row=7, column=0, columnspan=3, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        text_frame.grid(row=8, column=0, columnspan=3, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         text_frame.columnconfigure(0, weight=1)
         text_frame.rowconfigure(0, weight=1)
-        main_frame.rowconfigure(7, weight=1)
+        main_frame.rowconfigure(8, weight=1)
         
         self.results_text = tk.Text(text_frame, height=10, wrap=tk.WORD)
         scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.results_text.yview)
@@ -171,10 +497,25 @@ class ConverterGUI:
             self.output_dir_var.set(directory)
     
     def update_progress(self, current, total, filename):
-        progress = (current / total) * 100
-        self.progress_bar['value'] = progress
-        self.progress_var.set(f"Converting: {filename} ({current}/{total})")
-        self.root.update_idletasks()
+        # Runs in the worker thread, so only record the state for _flush_progress
+        with self._progress_lock:
+            self._pending_progress = (current, total, filename)
+    
+    def _flush_progress(self):
+        """Apply the latest progress update, then check again in 33 ms (~30 Hz)"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, None
+        
+        if pending is not None:
+            current, total, filename = pending
+            if str(self.progress_bar['mode']) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar.config(mode='determinate')
+            progress = (current / total) * 100
+            self.progress_bar['value'] = progress
+            self.progress_var.set(f"Converting: {filename} ({current}/{total})")
+        
+        self._flush_job = self.root.after(33, self._flush_progress)
     
     def start_conversion(self):
         input_dir = self.input_dir_var.get().strip()
@@ -196,63 +537,96 @@ class ConverterGUI:
         self.convert_btn.config(state='disabled')
         self.results_text.delete(1.0, tk.END)
         
-        # Start conversion in separate thread
-        thread = threading.Thread(target=self.perform_conversion, args=(input_dir, output_dir))
+        # The file count is unknown until the directory walk finishes
+        self.progress_var.set("Scanning for PNG files...")
+        self.progress_bar.config(mode='indeterminate')
+        self.progress_bar.start()
+        self._flush_job = self.root.after(33, self._flush_progress)
+        
+        # Start conversion in separate thread; Tk variables are read here since
+        # only the main thread may touch Tk
+        thread = threading.Thread(
+            target=self.perform_conversion,
+            args=(input_dir, output_dir, self.quality_var.get(),
+                  self.optimize_var.get(), not self.skip_existing_var.get()),
+        )
         thread.start()
     
-    def perform_conversion(self, input_dir, output_dir):
+    def perform_conversion(self, input_dir, output_dir, quality, optimize, overwrite):
         try:
-            successful, errors = self.converter.batch_convert(
+            self.converter.optimize = optimize
+            self.converter.overwrite = overwrite
+            successful, skipped, errors = self.converter.batch_convert(
                 input_dir, 
                 output_dir if output_dir != input_dir else None,
-                self.quality_var.get(),
+                quality,
                 self.update_progress
             )
             
             # Update UI in main thread
-            self.root.after(0, self.conversion_complete, successful, errors)
+            self.root.after(0, self.conversion_complete, successful, skipped, errors)
             
         except Exception as e:
             self.root.after(0, self.conversion_error, str(e))
     
-    def conversion_complete(self, successful, errors):
-        self.convert_btn.config(state='normal')
+    def reset_progress(self):
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+            self._flush_job = None
+        with self._progress_lock:
+            self._pending_progress = None
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate')
         self.progress_bar['value'] = 0
         self.progress_var.set("Ready")
+    
+    def conversion_complete(self, successful, skipped, errors):
+        self.convert_btn.config(state='normal')
+        self.reset_progress()
         
-        # Display results
-        result_text = f"Conversion Complete!\n\n"
-        result_text += f"Successfully converted: {len(successful)} files\n"
-        result_text += f"Errors: {len(errors)}\n\n"
+        # Display results, formatting only the entries that are shown
+        parts = [
+            "Conversion Complete!\n\n",
+            f"Successfully converted: {len(successful)} files\n",
+            f"Skipped (up to date): {len(skipped)} files\n",
+            f"Errors: {len(errors)}\n\n",
+        ]
         
         if successful:
-            result_text += "Converted files:\n"
-            for file_path in successful[:10]:  # Show first 10
-                result_text += f"✓ {os.path.basename(file_path)}\n"
+            shown_names = [os.path.basename(file_path) for file_path in successful[:10]]  # Show first 10
+            parts.append("Converted files:\n")
+            parts.extend(f"✓ {name}\n" for name in shown_names)
             if len(successful) > 10:
-                result_text += f"... and {len(successful) - 10} more\n"
+                parts.append(f"... and {len(successful) - 10} more\n")
         
         if errors:
-            result_text += "\nErrors:\n"
-            for error in errors[:5]:  # Show first 5 errors
-                result_text += f"✗ {error}\n"
+            parts.append("\nErrors:\n")
+            parts.extend(f"✗ {error}\n" for error in errors[:5])  # Show first 5 errors
             if len(errors) > 5:
-                result_text += f"... and {len(errors) - 5} more errors\n"
+                parts.append(f"... and {len(errors) - 5} more errors\n")
+        
+        if skipped:
+            parts.append("\nSkipped files already have an up-to-date JPG. Untick \"Skip existing\" "
+                         "to re-convert them after changing quality or other settings.\n")
         
+        result_text = ''.join(parts)
         self.results_text.insert(tk.END, result_text)
         
         # Show summary message
+        skipped_note = f" ({len(skipped)} up-to-date files skipped)" if skipped else ""
         if successful and not errors:
-            messagebox.showinfo("Success", f"Successfully converted {len(successful)} PNG files to JPG!")
+            messagebox.showinfo("Success", f"Successfully converted {len(successful)} PNG files to JPG!{skipped_note}")
+        elif skipped and not errors:
+            messagebox.showinfo("Nothing to Convert", f"All {len(skipped)} JPG files are already up to date. "
+                                "Untick \"Skip existing\" to re-convert them.")
         elif successful and errors:
-            messagebox.showwarning("Partial Success", f"Converted {len(successful)} files with {len(errors)} errors. Check results for details.")
+            messagebox.showwarning("Partial Success", f"Converted {len(successful)} files with {len(errors)} errors{skipped_note}. Check results for details.")
         else:
             messagebox.showerror("Error", "No files were converted. Check the results for error details.")
     
     def conversion_error(self, error_msg):
         self.convert_btn.config(state='normal')
-        self.progress_bar['value'] = 0
-        self.progress_var.set("Ready")
+        self.reset_progress()
         messagebox.showerror("Error", f"Conversion failed: {error_msg}")
 
 
@@ -261,6 +635,10 @@ def main():
     parser.add_argument('input_dir', nargs='?', help='Input directory containing PNG files')
     parser.add_argument('-o', '--output', help='Output directory (default: same as input)')
     parser.add_argument('-q', '--quality', type=int, default=95, help='JPG quality 1-100 (default: 95)')
+    parser.add_argument('--optimize', action='store_true', help='Optimize Huffman tables for slightly smaller files (slower)')
+    parser.add_argument('--force', action='store_true', help='Re-convert files whose JPG is already up to date (needed after changing quality or other settings)')
+    parser.add_argument('--async-io', action='store_true', help='Overlap file reads and writes with encoding (fast local disks, many small files)')
+    parser.add_argument('--threads', action='store_true', help='Use worker threads instead of processes (better for I/O-bound disks)')
     parser.add_argument('--gui', action='store_true', help='Launch GUI interface')
     
     args = parser.parse_args()
@@ -277,7 +655,10 @@ def main():
         parser.print_help()
         return
     
-    converter = PNGtoJPGConverter()
+    converter = PNGtoJPGConverter(use_processes=not args.threads)
+    converter.optimize = args.optimize
+    converter.overwrite = args.force
+    converter.async_io = args.async_io
     
     try:
         print(f"Converting PNG files in: {args.input_dir}")
@@ -285,7 +666,7 @@ def main():
         print(f"Quality: {args.quality}")
         print("-" * 50)
         
-        successful, errors = converter.batch_convert(
+        successful, skipped, errors = converter.batch_convert(
             args.input_dir,
             args.output,
             args.quality,
@@ -295,8 +676,13 @@ def main():
         print("-" * 50)
         print(f"Conversion complete!")
         print(f"Successfully converted: {len(successful)} files")
+        print(f"Skipped (up to date): {len(skipped)} files")
         print(f"Errors: {len(errors)}")
         
+        if skipped:
+            print("\nSkipped files already have an up-to-date JPG; use --force to re-convert "
+                  "them after changing quality or other settings.")
+        
         if errors:
             print("\nErrors encountered:")
             for error in errors: